@@ -22,11 +22,11 @@
 # SOFTWARE.
 
 import asyncio
-from inspect import signature, Parameter
-from json import loads, dumps
-from logging import info, debug
+import socket
+from inspect import signature, Parameter, getdoc
+from sys import intern
+from logging import getLogger
 from time import time
-from traceback import print_exc
 from typing import Awaitable, List, Union, Tuple, Any, Dict, Optional
 from uuid import uuid4
 
@@ -34,15 +34,65 @@ import websockets
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
 
 from .config import apiUrl, heartbeatInterval, topPublicRoomsInterval, telemetryInterval
-from .entities import Client, User, Room, UserPreview, Message, BaseUser, Context
+from .entities import Client, User, Room, UserPreview, Message, BaseUser, Context, Permission, _DEFAULT_PERMISSION
 from .exceptions import *
 from .utils.convertors import Convertor
 from .utils.parsers import parse_sentence_to_tokens as parse_message, parse_word_to_token as parse_word
 
-listeners = {}
+try:
+    # orjson parses and serializes in C, and dumps straight to bytes, so the
+    # codec skips both the stdlib overhead and the extra UTF-8 encode pass.
+    from orjson import dumps as _encode, loads
+except (ImportError, ModuleNotFoundError):
+    from json import dumps as _dumps, loads
+
+    def _encode(payload) -> bytes:
+        return _dumps(payload).encode("utf-8")
+
+try:
+    # libuv-backed event loop; a drop-in replacement that gets picked up by
+    # run() when installed.
+    import uvloop
+except (ImportError, ModuleNotFoundError):
+    uvloop = None
+
+# Module logger; the logging.info/debug module functions would implicitly
+# configure the root logger and format eagerly, whereas deferred %-style
+# arguments only get formatted when a handler actually listens.
+logger = getLogger("dogehouse")
+
 commands = {}
 
 
+class Command:
+    """
+    The registration record for a single command.
+
+    Everything execute_command needs per invocation — the callback, its
+    precomputed parameter spec and the cached help text — lives behind one
+    attribute access instead of positional list indexing.
+    """
+
+    __slots__ = ('func', 'bound', 'cooldown', 'takes_context', 'spec', 'help')
+
+    def __init__(self, func: Awaitable, bound: bool, cooldown: int, takes_context: bool, spec: Tuple, help: str):
+        self.func = func
+        self.bound = bound
+        self.cooldown = cooldown
+        self.takes_context = takes_context
+        self.spec = spec
+        self.help = help
+
+
+def _set_room_permission(user: User, attribute: str, value: bool):
+    """Flip a room permission flag, giving the user their own Permission object first when they still hold the
+    shared all-False singleton."""
+    permissions = user.room_permissions
+    if permissions is _DEFAULT_PERMISSION:
+        user.room_permissions = permissions = Permission(False, False, False, False)
+    setattr(permissions, attribute, value)
+
+
 def event(func: Awaitable, *, name: str = None):
     """
     Create an event listener for dogehouse.
@@ -63,11 +113,43 @@ def event(func: Awaitable, *, name: str = None):
     """
 
     def wrapper(_func: Awaitable):
-        listeners[(Convertor.convert_basic_types(name, str) if name else func.__name__).lower()] = [func, False]
+        _func.__doge_listener__ = (Convertor.convert_basic_types(name, str) if name else _func.__name__).lower()
+        return _func
 
     return wrapper(func) if func else wrapper
 
 
+def _build_param_spec(func: Awaitable, bound: bool):
+    """
+    Precompute the argument pipeline for a command at registration time.
+
+    Inspecting the signature and resolving each parameter's convertor happens
+    once here, so `execute_command` only performs direct calls per argument.
+
+    Args:
+        func (Awaitable): The command callback.
+        bound (bool): Whether the callback is already bound. (Aka does not take `self`)
+
+    Returns:
+        tuple: Whether the command takes a context argument, and a tuple with
+               `(name, parameter, custom convertor, basic convertor)` per remaining parameter.
+    """
+    parameters = list(signature(func).parameters.values())
+    if not bound:
+        parameters.pop(0)
+
+    takes_context = bool(parameters)
+    if takes_context:
+        parameters.pop(0)
+
+    spec = []
+    for param in parameters:
+        convert = getattr(param.annotation, "convert", None)
+        spec.append((param.name, param, convert if callable(convert) else None, Convertor.build(param)))
+
+    return takes_context, tuple(spec)
+
+
 def command(func: Awaitable = None, *, name: str = None, cooldown: int = 0, aliases: List[str] = []):
     """
     Create a new DogeClient command, which will be handled by the dogehouse python library.
@@ -90,13 +172,18 @@ def command(func: Awaitable = None, *, name: str = None, cooldown: int = 0, alia
     """
 
     def wrapper(_func: Awaitable):
+        takes_context, spec = _build_param_spec(_func, False)
+        # The cleaned-up docstring gets stored alongside the command, so
+        # help commands do not have to run inspect reflection per call.
+        help_doc = getdoc(_func)
+
         def save(_name: str):
             if _name in commands:
                 raise CommandAlreadyDefined(f"Command `{_name}` has already been defined by a name or alias!")
-            commands[_name] = [_func, False, int(cooldown)]
+            commands[_name] = Command(_func, False, int(cooldown), takes_context, spec, help_doc)
 
         for cmd_name in (name if name else _func.__name__, *aliases):
-            save(Convertor.convert_basic_types(cmd_name, str).lower())
+            save(intern(Convertor.convert_basic_types(cmd_name, str).lower()))
 
         return _func
 
@@ -106,8 +193,28 @@ def command(func: Awaitable = None, *, name: str = None, cooldown: int = 0, alia
 class DogeClient(Client):
     """Represents your Dogehouse client."""
 
+    # The client's own state lives in slots as well, so the hot event loop
+    # reads attributes through C-level descriptors. Subclasses that do not
+    # declare __slots__ still get a __dict__ for their own attributes.
+    __slots__ = ('__token', '__refresh_token', '__socket', '__send_queue', '__flush_interval', '__active',
+                 '__muted', '__reconnect_voice', '_listeners', '_prefixes', '__fetches', '__commands',
+                 '__waiting_for', '__waiting_for_fetches', '__command_cooldown_cache', '__session_id',
+                 '__fetch_counter', '_loop', 'telemetry')
+
+    _event_listeners = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        events = dict(cls._event_listeners)
+        for member in vars(cls).values():
+            listener_name = getattr(member, "__doge_listener__", None)
+            if listener_name:
+                events[listener_name] = member
+        cls._event_listeners = events
+
     def __init__(self, token: str, refresh_token: str, *, room: str = None, muted: bool = False,
-                 reconnect_voice: bool = False, prefix: Union[str, List[str]] = "!", telemetry=None):
+                 reconnect_voice: bool = False, prefix: Union[str, List[str]] = "!", flush_interval: float = 0,
+                 telemetry=None):
         """
         Initialize your Dogehouse client
 
@@ -119,22 +226,37 @@ class DogeClient(Client):
             reconnect_voice (bool, optional): When the client disconnects from the voice server, should it try to
                                               reconnect. Defaults to False.
             prefix (List of strings or a string, optional): The bot prefix.
+            flush_interval (float, optional): How long (in seconds) the writer waits to coalesce a burst of
+                                              outgoing messages before flushing them. Defaults to 0. (flush
+                                              immediately)
             telemetry (telemetry class, optional): The telemetry class that will be used. Defaults to None.
         """
         super().__init__(None, room, [], prefix)
 
+        # The prefix list gets normalized once, so the per-message command
+        # dispatch iterates a tuple instead of rebuilding one per message.
+        self._prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+
         self.__token = token
         self.__refresh_token = refresh_token
         self.__socket = None
+        self.__send_queue = None
+        self.__flush_interval = flush_interval
         self.__active = False
         self.__muted = muted
         self.__reconnect_voice = reconnect_voice
-        self.__listeners = listeners
+        self._listeners = {name: [func, False] for name, func in self._event_listeners.items()}
         self.__fetches = {}
         self.__commands = commands
         self.__waiting_for = {}
         self.__waiting_for_fetches = {}
         self.__command_cooldown_cache = {}
+        # Fetch ids only have to be unique within this session's in-flight
+        # fetches, so a session prefix plus a counter avoids the urandom read
+        # that uuid4() performs on every fetch.
+        self.__session_id = uuid4().hex[:8]
+        self.__fetch_counter = 0
+        self._loop = None
         self.telemetry = telemetry
 
         if telemetry:
@@ -144,8 +266,12 @@ class DogeClient(Client):
     def commands(self):
         return self.__commands
 
+    def __next_fetch_id(self) -> str:
+        self.__fetch_counter += 1
+        return f"{self.__session_id}-{self.__fetch_counter}"
+
     async def __fetch(self, op: str, data: dict):
-        fetch = str(uuid4())
+        fetch = self.__next_fetch_id()
 
         await self.__send(op, data, fetch_id=fetch)
         self.__fetches[fetch] = op
@@ -155,18 +281,24 @@ class DogeClient(Client):
         raw_data = dict(op=opcode, d=data)
         if fetch_id:
             raw_data["fetchId"] = fetch_id
-        await self.__socket.send(dumps(raw_data))
+        # Frames get queued for the single writer task; sending bytes lets
+        # the websocket library skip its UTF-8 validation pass.
+        self.__send_queue.put_nowait(_encode(raw_data))
 
     async def __main(self, loop):
         """This instance handles the websocket connections."""
 
         async def event_loop():
+            # The cached loop's create_task skips the running-loop lookup
+            # that asyncio.ensure_future performs per call.
+            create_task = self._loop.create_task
+
             async def execute_listener(listener: str, *args):
                 listener_name = listener.lower()
-                listener = self.__listeners.get(listener_name)
+                listener = self._listeners.get(listener_name)
 
                 if listener:
-                    asyncio.ensure_future(listener[0](
+                    create_task(listener[0](
                         *(args if listener[1] else [self, *args])))
 
                 if listener_name[3::] in self.__waiting_for:
@@ -180,46 +312,52 @@ class DogeClient(Client):
                 if _command:
                     instance_id = f"{command_name}-{ctx.author.id}"
                     invoked_at = time()
-                    if _command[2] and instance_id in self.__command_cooldown_cache:
+                    cooldown = _command.cooldown
+                    if cooldown and instance_id in self.__command_cooldown_cache:
                         passed = invoked_at - self.__command_cooldown_cache[instance_id]
-                        if passed < _command[2]:
-                            return await execute_listener("on_cooldown_trigger", ctx, command_name, _command[0],
-                                                          _command[2] - passed)
+                        if passed < cooldown:
+                            return await execute_listener("on_cooldown_trigger", ctx, command_name, _command.func,
+                                                          cooldown - passed)
 
                     arguments = []
                     params = {}
-                    parameters = list(signature(_command[0]).parameters.items())
-                    if not _command[1]:
+                    if not _command.bound:
                         arguments.append(self)
-                        parameters.pop(0)
 
                     try:
-                        if parameters:
+                        if _command.takes_context:
                             arguments.append(ctx)
-                            parameters.pop(0)
-
-                            for idx, (key, param) in enumerate(parameters):
-                                if idx + 1 > len(args) and param.default != Parameter.empty:
-                                    params[key] = param.default
-                                    continue
-                                else:
-                                    value = args[idx]
-
-                                    if param.kind == param.KEYWORD_ONLY and len(args) - idx - 1 != 0:
-                                        value = " ".join(args[idx::])
-
-                                value = value.strip()
+                            spec = _command.spec
+
+                            # Fast path for (self, ctx)-only commands: with an
+                            # empty precomputed spec there is nothing to bind,
+                            # so the invocation goes straight to the call.
+                            if spec:
+                                # The parameter spec got precomputed at
+                                # registration, so each argument costs one
+                                # converter call here.
+                                for idx, (key, param, convert, converter) in enumerate(spec):
+                                    if idx + 1 > len(args) and param.default != Parameter.empty:
+                                        params[key] = param.default
+                                        continue
+                                    else:
+                                        value = args[idx]
+
+                                        if param.kind == param.KEYWORD_ONLY and len(args) - idx - 1 != 0:
+                                            value = " ".join(args[idx::])
+
+                                    value = value.strip()
+
+                                    if value and convert:
+                                        value = await convert(ctx, param, value)
+                                    else:
+                                        value = converter(value)
+
+                                    params[key] = value
 
-                                if value and param.annotation and hasattr(param.annotation, "convert") and callable(
-                                        param.annotation.convert):
-                                    value = await param.annotation.convert(ctx, param, value)
-                                else:
-                                    value = Convertor.handle_basic_types(param, value)
-
-                                params[key] = value
                             self.__command_cooldown_cache[instance_id] = invoked_at
 
-                        asyncio.ensure_future(_command[0](*arguments, **params))
+                        create_task(_command.func(*arguments, **params))
                     except (IndexError, TypeError):
                         raise NotEnoughArguments(
                             f"Not enough arguments were provided in command `{command_name}`.")
@@ -227,152 +365,264 @@ class DogeClient(Client):
                     raise CommandNotFound(
                         f"The requested command `{command_name}` does not exist.")
 
-            info("Dogehouse: Starting event listener loop")
-            while self.__active:
-                res: Dict[str, Union[Dict, Any]] = loads(await self.__socket.recv())
-                op = res if isinstance(res, str) else res.get("op")
-                if op == "auth-good":
-                    info("Dogehouse: Received client ready")
-                    self.user = User.from_dict(dict(res["d"]["user"]))
-                    await execute_listener("on_ready")
-                elif op == "new-tokens":
-                    info("Dogehouse: Received new authorization tokens")
-                    self.__token = res["d"]["accessToken"]
-                    self.__refresh_token = res["d"]["refreshToken"]
-                elif op == "fetch_done":
-                    fetch = self.__fetches.get(res.get("fetchId"), False)
-                    if fetch:
-                        del self.__fetches[res.get("fetchId")]
-                        if fetch == "get_top_public_rooms":
-                            info("Dogehouse: Received new rooms")
-                            self.rooms = list(
-                                map(Room.from_dict, res["d"]["rooms"]))
-                            await execute_listener("on_rooms_fetch")
-                        elif fetch == "create_room":
-                            info("Dogehouse: Created new room")
-                            self.room = Room.from_dict(res["d"]["room"])
-                            self.room.users = [self.user]
-                        elif fetch == "get_user_profile":
-                            usr = User.from_dict(res["d"])
-                            info(f"Dogehouse: Received user `{usr.id}`")
-                            if usr.current_room_id == self.room.id:
-                                self.room.users = [(user if user.id != usr.id else usr) for user in self.room.users]
-                            await execute_listener("on_user_fetch", usr)
-                elif op == "you-joined-as-speaker":
-                    await execute_listener("on_room_join", True)
-                elif op == "join_room_done":
-                    self.room = Room.from_dict(res["d"]["room"])
-                    self.room.users.append(self.user)
-                    await self.__send("get_current_room_users", {})
-                    # for user in self.room.users:
-                    #     if not isinstance(user, User):
-                    #         await self.__fetch("get_user_profile", dict(userId=user.id))
-
-                    # TODO: Check if joined as speaker 
-                    await execute_listener("on_room_join", False)
-                elif op == "new_user_join_room":
-                    user = User.from_dict(res["d"]["user"])
-                    self.room.users.append(user)
-                    await execute_listener("on_user_join", user)
-                elif op == "user_left_room":
-                    user = [user for user in self.room.users if user.id == res["d"]["userId"]][0]
-                    self.room.users.remove(user)
-                    await execute_listener("on_user_leave", user)
-                elif op == "new_chat_msg":
-                    msg = Message.from_dict(res["d"]["msg"])
-                    await execute_listener("on_message", msg)
-
-                    if msg.author.id == self.user.id:
-                        continue
-
-                    try:
-                        async def handle_command(_prefix: str):
-                            if msg.content.startswith(_prefix) and len(msg.content) > len(_prefix) + 1:
-                                splitted = msg.content[len(_prefix)::].split(" ")
-                                await execute_command(splitted[0], Context(self, msg), *splitted[1::])
-                                return True
-                            return False
-
-                        prefixes = [self.prefix] if isinstance(
-                            self.prefix, str) else self.prefix
-
-                        for prefix in prefixes:
-                            if await handle_command(prefix):
-                                break
-                    except Exception as err:
-                        if "on_error" not in self.__listeners:
-                            print_exc()
-                        else:
-                            await execute_listener("on_error", err)
-                elif op == "message_deleted":
-                    await execute_listener("on_message_delete", res["d"]["deleterId"], res["d"]["messageId"])
-                elif op == "speaker_added":
-                    for user in self.room.users:
-                        if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
-                            user.room_permissions.is_speaker = True
-                            await execute_listener("on_speaker_add", user, res["d"]["muteMap"])
-                            break
-                elif op == "speaker_removed":
-                    for user in self.room.users:
-                        if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
-                            user.room_permissions.is_speaker = False
-                            await execute_listener("on_speaker_delete", user, res["d"]["muteMap"],
-                                                   res["d"]["raiseHandMap"])
+            # Local bindings so the hot paths resolve these with LOAD_FAST
+            # instead of a global lookup.
+            _Room, _User, _Message = Room, User, Message
+
+            async def on_auth_good(res):
+                logger.info("Dogehouse: Received client ready")
+                self.user = _User.from_dict(dict(res["d"]["user"]))
+                await execute_listener("on_ready")
+
+            async def on_new_tokens(res):
+                logger.info("Dogehouse: Received new authorization tokens")
+                self.__token = res["d"]["accessToken"]
+                self.__refresh_token = res["d"]["refreshToken"]
+
+            async def on_fetch_done(res):
+                fetch = self.__fetches.pop(res.get("fetchId"), None)
+                if fetch:
+                    if fetch == "get_top_public_rooms":
+                        logger.info("Dogehouse: Received new rooms")
+                        self.rooms = [_Room.from_dict(r) for r in res["d"]["rooms"]]
+                        await execute_listener("on_rooms_fetch")
+                    elif fetch == "create_room":
+                        logger.info("Dogehouse: Created new room")
+                        self.room = _Room.from_dict(res["d"]["room"])
+                        self.room.users = [self.user]
+                    elif fetch == "get_user_profile":
+                        usr = _User.from_dict(res["d"])
+                        logger.info("Dogehouse: Received user `%s`", usr.id)
+                        if usr.current_room_id == self.room.id:
+                            self.room.users = [(user if user.id != usr.id else usr) for user in self.room.users]
+                        await execute_listener("on_user_fetch", usr)
+
+            async def on_you_joined_as_speaker(res):
+                await execute_listener("on_room_join", True)
+
+            async def on_join_room_done(res):
+                self.room = _Room.from_dict(res["d"]["room"])
+                self.room.users.append(self.user)
+                await self.__send("get_current_room_users", {})
+                # for user in self.room.users:
+                #     if not isinstance(user, User):
+                #         await self.__fetch("get_user_profile", dict(userId=user.id))
+
+                # TODO: Check if joined as speaker
+                await execute_listener("on_room_join", False)
+
+            async def on_new_user_join_room(res):
+                user = _User.from_dict(res["d"]["user"])
+                self.room.users.append(user)
+                await execute_listener("on_user_join", user)
+
+            async def on_user_left_room(res):
+                user = [user for user in self.room.users if user.id == res["d"]["userId"]][0]
+                self.room.users.remove(user)
+                await execute_listener("on_user_leave", user)
+
+            async def on_new_chat_msg(res):
+                msg = _Message.from_dict(res["d"]["msg"])
+                await execute_listener("on_message", msg)
+
+                if msg.author.id == self.user.id:
+                    return
+
+                try:
+                    content = msg.content
+                    for prefix in self._prefixes:
+                        if content.startswith(prefix) and len(content) > len(prefix) + 1:
+                            splitted = content[len(prefix)::].split(" ")
+                            await execute_command(splitted[0], Context(self, msg), *splitted[1::])
                             break
-                elif op == "chat_user_banned":
-                    await execute_listener("on_user_ban", res["d"]["userId"])
-                elif op == "hand_raised":
-                    await execute_listener("on_speaker_request", res["d"]["userId"], res["d"]["roomId"])
-                elif op == "get_current_room_users_done":
-                    self.room.users = list(map(User.from_dict, res["d"]["users"]))
-                    for user in self.room.users:
-                        if user.id == self.room.creator_id:
-                            user.room_permissions.is_admin = True
-                    await execute_listener("on_room_users_fetch")
-                elif op == "mod_changed" or op == "new_room_creator":
-                    changed_permission_type = "mod" if op == "mod_changed" else "admin"
-                    attribute = f"is_{changed_permission_type}"
-
-                    if changed_permission_type == "admin":
-                        for user in self.room.users:
-                            if user.room_permissions.is_admin:
-                                user.room_permissions.is_admin = False
-                                await execute_listener("on_permission_change", user, changed_permission_type)
-
+                except Exception as err:
+                    if "on_error" not in self._listeners:
+                        # Deferred formatting: the traceback only gets
+                        # rendered when a handler is actually listening.
+                        logger.exception("Dogehouse: Unhandled command error")
+                    else:
+                        await execute_listener("on_error", err)
+
+            async def on_message_deleted(res):
+                await execute_listener("on_message_delete", res["d"]["deleterId"], res["d"]["messageId"])
+
+            async def on_speaker_added(res):
+                for user in self.room.users:
+                    if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
+                        _set_room_permission(user, "is_speaker", True)
+                        await execute_listener("on_speaker_add", user, res["d"]["muteMap"])
+                        break
+
+            async def on_speaker_removed(res):
+                for user in self.room.users:
+                    if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
+                        _set_room_permission(user, "is_speaker", False)
+                        await execute_listener("on_speaker_delete", user, res["d"]["muteMap"],
+                                               res["d"]["raiseHandMap"])
+                        break
+
+            async def on_chat_user_banned(res):
+                await execute_listener("on_user_ban", res["d"]["userId"])
+
+            async def on_hand_raised(res):
+                await execute_listener("on_speaker_request", res["d"]["userId"], res["d"]["roomId"])
+
+            async def on_get_current_room_users_done(res):
+                self.room.users = list(map(_User.from_dict, res["d"]["users"]))
+                for user in self.room.users:
+                    if user.id == self.room.creator_id:
+                        _set_room_permission(user, "is_admin", True)
+                await execute_listener("on_room_users_fetch")
+
+            async def on_permissions_changed(res, changed_permission_type):
+                attribute = f"is_{changed_permission_type}"
+
+                if changed_permission_type == "admin":
                     for user in self.room.users:
-                        if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
-                            setattr(user.room_permissions, attribute, not getattr(user.room_permissions, attribute))
-                            await execute_listener("on_permissions_change", user, changed_permission_type)
-                            break
-
-        async def heartbeat():
-            debug("Dogehouse: Starting heartbeat")
+                        if user.room_permissions.is_admin:
+                            _set_room_permission(user, "is_admin", False)
+                            await execute_listener("on_permission_change", user, changed_permission_type)
+
+                for user in self.room.users:
+                    if user.id == res["d"]["userId"] and user.current_room_id == res["d"]["roomId"]:
+                        _set_room_permission(user, attribute, not getattr(user.room_permissions, attribute))
+                        await execute_listener("on_permissions_change", user, changed_permission_type)
+                        break
+
+            async def on_mod_changed(res):
+                await on_permissions_changed(res, "mod")
+
+            async def on_new_room_creator(res):
+                await on_permissions_changed(res, "admin")
+
+            # Built once per connection: every op resolves through a single
+            # dict probe instead of walking an elif chain of comparisons.
+            handlers = {
+                "auth-good": on_auth_good,
+                "new-tokens": on_new_tokens,
+                "fetch_done": on_fetch_done,
+                "you-joined-as-speaker": on_you_joined_as_speaker,
+                "join_room_done": on_join_room_done,
+                "new_user_join_room": on_new_user_join_room,
+                "user_left_room": on_user_left_room,
+                "new_chat_msg": on_new_chat_msg,
+                "message_deleted": on_message_deleted,
+                "speaker_added": on_speaker_added,
+                "speaker_removed": on_speaker_removed,
+                "chat_user_banned": on_chat_user_banned,
+                "hand_raised": on_hand_raised,
+                "get_current_room_users_done": on_get_current_room_users_done,
+                "mod_changed": on_mod_changed,
+                "new_room_creator": on_new_room_creator,
+            }
+            get_handler = handlers.get
+            recv = self.__socket.recv
+            wait_for = asyncio.wait_for
+
+            logger.info("Dogehouse: Starting event listener loop")
+            # The heartbeat runs on an absolute deadline: busy rooms keep
+            # recv from ever timing out, so the remaining time until the
+            # next ping bounds the wait instead of a fixed interval.
+            next_ping = time() + heartbeatInterval
+            while self.__active:
+                remaining = next_ping - time()
+                if remaining <= 0:
+                    self.__send_queue.put_nowait("ping")
+                    next_ping = time() + heartbeatInterval
+                    remaining = heartbeatInterval
+                try:
+                    raw = await wait_for(recv(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+
+                # The server answers the heartbeat with a bare "pong" frame,
+                # which does not warrant a JSON parse.
+                if raw == "pong":
+                    continue
+
+                res: Dict[str, Union[Dict, Any]] = loads(raw)
+                # The odd frame decodes to a bare string (e.g. a quoted
+                # pong); those carry the op themselves.
+                op = res if isinstance(res, str) else res.get("op")
+                if op:
+                    # Interned so the dict probe compares keys by identity.
+                    handler = get_handler(intern(op))
+                    if handler:
+                        await handler(res)
+
+        async def sender_loop():
+            # Single writer which drains the outgoing queue: one blocking get
+            # for the first frame, then non-blocking gets until the burst is
+            # exhausted, so bursts go out back-to-back without waking the
+            # writer per frame. The dogehouse protocol has no batch opcode,
+            # which is why the frames still go out individually.
+            queue = self.__send_queue
+            get_nowait = queue.get_nowait
+            send = self.__socket.send
+            sleep = asyncio.sleep
+            flush_interval = self.__flush_interval
             while self.__active:
-                await self.__socket.send("ping")
-                await asyncio.sleep(heartbeatInterval)
+                frame = await queue.get()
+                if flush_interval:
+                    # Nagle-style coalescing: hold the first frame briefly so
+                    # the rest of a burst lands in the queue and the whole
+                    # batch drains in one go.
+                    await sleep(flush_interval)
+                try:
+                    sent = 0
+                    while True:
+                        await send(frame)
+                        # A send over an unsaturated socket completes without
+                        # suspending, so long drains yield explicitly every
+                        # so often instead of monopolizing the event loop.
+                        sent += 1
+                        if not sent % 32:
+                            await sleep(0)
+                        frame = get_nowait()
+                except asyncio.QueueEmpty:
+                    continue
 
         async def get_top_rooms_loop():
-            debug("Dogehouse: Starting to get all rooms")
+            logger.debug("Dogehouse: Starting to get all rooms")
             while self.__active and not self.room:
                 await self.get_top_public_rooms()
                 await asyncio.sleep(topPublicRoomsInterval)
 
         async def perform_telemetry():
             if self.telemetry:
-                debug("Dogehouse: Starting to perform telemetry")
+                logger.debug("Dogehouse: Starting to perform telemetry")
 
                 while self.telemetry and self.__active:
                     await self.telemetry.transmit(self)
                     await asyncio.sleep(telemetryInterval)
 
         try:
-            info("Dogehouse: Connecting with Dogehouse websocket")
-            async with websockets.connect(apiUrl) as ws:
-                info("Dogehouse: Websocket connection established successfully")
+            logger.info("Dogehouse: Connecting with Dogehouse websocket")
+            # Compression is disabled because the dogehouse messages are small
+            # JSON payloads, where the per-frame zlib work costs more than the
+            # bandwidth it saves. The library's own ping is suppressed as the
+            # client runs its own application-level heartbeat.
+            async with websockets.connect(apiUrl, compression=None, max_size=2 ** 20, max_queue=2 ** 14,
+                                          ping_interval=None, ping_timeout=None) as ws:
+                logger.info("Dogehouse: Websocket connection established successfully")
                 self.__active = True
                 self.__socket = ws
-
-                info("Dogehouse: Attempting to authenticate")
+                self.__send_queue = asyncio.Queue()
+
+                # Kernel-side tuning: bigger socket buffers absorb chat
+                # bursts without extra loop wakeups, and TCP_NODELAY keeps
+                # the batching in the writer task instead of in Nagle.
+                try:
+                    raw_socket = ws.transport.get_extra_info("socket")
+                    if raw_socket is not None:
+                        raw_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                        raw_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+                        raw_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except (AttributeError, OSError):
+                    # Best effort; transport internals differ per version/platform.
+                    pass
+
+                logger.info("Dogehouse: Attempting to authenticate")
                 await self.__send('auth', {
                     "accessToken": self.__token,
                     "refreshToken": self.__refresh_token,
@@ -381,17 +631,21 @@ class DogeClient(Client):
                     "currentRoomId": self.room,
                     "platform": "dogehouse.py"
                 })
-                info("Dogehouse: Successfully authenticated")
-
-                event_loop_task = loop.create_task(event_loop())
-                get_top_rooms_task = loop.create_task(get_top_rooms_loop())
-                perform_telemetry_task = loop.create_task(perform_telemetry())
-                await heartbeat()
-                await event_loop_task()
-                await get_top_rooms_task()
-                await perform_telemetry_task()
+                logger.info("Dogehouse: Successfully authenticated")
+
+                # gather does not cancel its siblings when one of them
+                # raises, which would leave the writer parked on its queue
+                # (and the periodic loops on their sleeps) past loop.close().
+                tasks = [loop.create_task(coro) for coro in
+                         (event_loop(), sender_loop(), get_top_rooms_loop(), perform_telemetry())]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
         except ConnectionClosedOK:
-            info("Dogehouse: Websocket connection closed peacefully")
+            logger.info("Dogehouse: Websocket connection closed peacefully")
             self.__active = False
         except ConnectionClosedError as e:
             if e.code == 4004:
@@ -399,7 +653,9 @@ class DogeClient(Client):
 
     def run(self):
         """Establishes a connection to the websocket servers."""
-        loop = asyncio.get_event_loop()
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        self._loop = loop = asyncio.get_event_loop()
         loop.run_until_complete(self.__main(loop))
         loop.close()
 
@@ -443,7 +699,7 @@ class DogeClient(Client):
         """
 
         def decorator(func: Awaitable):
-            self.__listeners[str(name if name else func.__name__).lower()] = [
+            self._listeners[str(name if name else func.__name__).lower()] = [
                 func, True]
             return func
 
@@ -477,8 +733,8 @@ class DogeClient(Client):
         """
 
         def decorator(func: Awaitable):
-            self.__commands[str(name if name else func.__name__).lower()] = [
-                func, True]
+            self.__commands[intern(str(name if name else func.__name__).lower())] = Command(
+                func, True, 0, *_build_param_spec(func, True), getdoc(func))
             return func
 
         return decorator
@@ -617,7 +873,8 @@ class DogeClient(Client):
             user (Union[str, User, BaseUser, UserPreview]): The user who should be unbanned.
         """
         await self.__send("unban_from_room",
-                          dict(userId=str((user if isinstance(user, str) else user.id)), fetch_id=uuid4()))
+                          dict(userId=str((user if isinstance(user, str) else user.id)),
+                               fetch_id=self.__next_fetch_id()))
 
     async def add_speaker(self, user: Union[str, User, BaseUser, UserPreview]):
         """
@@ -656,7 +913,7 @@ class DogeClient(Client):
         Returns:
             Union[Any, Tuple[Any]]: The parameter(s) of the event.
         """
-        fetch_id = str(uuid4())
+        fetch_id = self.__next_fetch_id()
         self.__waiting_for[event_name] = [*self.__waiting_for[event_name],
                                           fetch_id] if event_name in self.__waiting_for else [fetch_id]
 
@@ -688,48 +945,10 @@ class DogeClient(Client):
                         continue
                 return (*data[0],) if len(data[0]) > 1 else data[0][0]
 
-<<<<<<< HEAD
-    async def fetch_user(self, argument: str, *, tick=0.5, timeout=60) -> User:
-        """Currently only calls the DogeClient.get_user method, will implement user fetching in the future tho."""
-        # try:
-        return self.get_user(argument)
-        # except MemberNotFound:
-        #     op = "get_user_profile"
-        #     fetch_id = str(uuid4())
-        #
-        #     async def user_fetch_task():
-        #         await self.__send(op, dict(userId=argument), fetch_id=fetch_id)
-        #         self.__fetches[fetch_id] = op
-        #         self.__waiting_for[op] = [*self.__waiting_for[op], fetch_id] if op in self.__waiting_for else [fetch_id]
-        #         passed = 0
-        #         while True:
-        #             print("fetch", passed)
-        #             passed += tick
-        #             await asyncio.sleep(tick)
-        #             if passed > timeout:
-        #                 self.__waiting_for[op].remove(fetch_id)
-        #                 raise asyncio.TimeoutError(f"wait_for event timed out while fetching user `{argument}`")
-        #             elif fetch_id in self.__waiting_for_fetches:
-        #                 data = self.__waiting_for_fetches[fetch_id]
-        #                 return data
-        #
-        #     task = asyncio.ensure_future(user_fetch_task())
-        #     return await task
-
-        # TODO: IMPLEMENT USER FETCHING
-        #     async def waiter():
-        #         return await self.wait_for("user_fetch", fetch_arguments=("get_user_profile", dict(userId=value)))
-
-        #     user = await waiter()
-
-        #     if user:
-        #         return user
-=======
     async def fetch_user(self, argument: str) -> Optional[User]:
         """
         Goes through the local cache to check if a user can be found.
         If no user has been found it will send a request to the server to try and fetch that user.
->>>>>>> 134de9535ed487551d22b01b4fb627c45f260f23
 
         Args:
             argument (str): The user argument
@@ -22,11 +22,7 @@
 # SOFTWARE.
 
 # Semantic Version
-<<<<<<< HEAD
-__version__ = "2.1.3"
-=======
 __version__ = "2.1.4"
->>>>>>> 134de9535ed487551d22b01b4fb627c45f260f23
 
 # The socket url for the dogehouse API
 apiUrl = "wss://api.dogehouse.tv/socket"
@@ -22,16 +22,37 @@
 # SOFTWARE.
 
 from datetime import datetime
+from functools import lru_cache
+from sys import intern
 from typing import Dict, List, Union, Optional
 
 from dateutil.parser import isoparse
-from represents import Represents as Repr
 
-from .utils.convertors import Convertor
+from .utils.convertors import get_user
 from .utils.parsers import parse_tokens_to_message as parse_tokens
+from .utils.representation import fast_repr
 
 
-class BaseUser(Convertor, Repr):
+@lru_cache(maxsize=4096)
+def _iso(timestamp: str) -> datetime:
+    """
+    Memoized ISO-8601 parser, as chat-heavy workloads parse the same second-precision timestamps over and over.
+
+    The server emits a fixed ISO-8601 format, so the C-implemented
+    `datetime.fromisoformat` handles virtually every timestamp; dateutil's
+    generic (and much slower) isoparse only remains as a fallback for the
+    odd variation `fromisoformat` refuses.
+    """
+    try:
+        return datetime.fromisoformat(timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp)
+    except ValueError:
+        return isoparse(timestamp)
+
+
+@fast_repr
+class BaseUser:
+    __slots__ = ('id', 'username', 'displayname', 'avatar_url', '_mention')
+
     def __init__(self, user_id: str, username: str, displayname: str, avatar_url: str):
         """
         Represents the most basic information of a fetched user.
@@ -42,15 +63,26 @@ class BaseUser(Convertor, Repr):
             displayname (str): The displayname of the user.
             avatar_url (str): The user their avatar URL.
         """
-        self.id: str = user_id
-        self.username: str = username
-        self.displayname: str = displayname
+        # Ids and author names repeat constantly across a message stream,
+        # interning them deduplicates the storage and makes the frequent
+        # `user.id == ...` comparisons pointer-checks.
+        self.id: str = intern(user_id) if user_id else user_id
+        self.username: str = intern(username) if username else username
+        self.displayname: str = intern(displayname) if displayname else displayname
         self.avatar_url: str = avatar_url
-        self.mention: str = f"@{username}"
+        self._mention: Optional[str] = None
 
     def __str__(self):
         return self.username
 
+    @property
+    def mention(self) -> str:
+        """The user their mention tag. (`@username`, built and interned on first access)"""
+        mention = self._mention
+        if mention is None:
+            self._mention = mention = intern("@" + self.username)
+        return mention
+
     @staticmethod
     def from_dict(data: dict):
         """
@@ -66,10 +98,13 @@ class BaseUser(Convertor, Repr):
 
     @classmethod
     async def convert(cls, ctx, param, argument: str):
-        return (await cls._get_user(cls.__name__, ctx.client, param, argument)).to_base_user()
+        return (await get_user(cls.__name__, ctx.client, param, argument)).to_base_user()
+
 
+@fast_repr
+class Permission:
+    __slots__ = ('asked_to_speak', 'is_mod', 'is_admin', 'is_speaker')
 
-class Permission(Repr):
     def __init__(self, asked_to_speak: bool, is_mod: bool, is_admin: bool, is_speaker: bool):
         """
         Represents a user their permissions
@@ -96,13 +131,32 @@ class Permission(Repr):
         Returns:
             Permission: A parsed Permission object which contains the data from the dictionary.
         """
-        if data:
-            return Permission(data.get("askedToSpeak", False), data.get("isMod", False), False,
-                              data.get("isSpeaker", False))
-        return Permission(False, False, False, False)
+        if not data:
+            return _DEFAULT_PERMISSION
+        get = data.get
+        # is_admin is never part of the payload; it gets derived from the
+        # room creator by the client.
+        return Permission(get("askedToSpeak", False), get("isMod", False), False, get("isSpeaker", False))
+
+
+@lru_cache(maxsize=1024)
+def _author(user_id: str, username: str, displayname: str, avatar_url: str) -> BaseUser:
+    """Memoized BaseUser construction, so consecutive messages from the same author share one instance."""
+    return BaseUser(user_id, username, displayname, avatar_url)
+
 
+# Users without room permissions all share this singleton instead of each
+# allocating an identical all-False object. Anything that wants to flip a
+# flag has to replace it with a fresh Permission first. (see
+# DogeClient's permission updates)
+_DEFAULT_PERMISSION = Permission(False, False, False, False)
+
+
+@fast_repr
+class User(BaseUser):
+    __slots__ = ('bio', '_last_seen_raw', '_last_seen', 'online', 'following', 'room_permissions',
+                 'num_followers', 'num_following', 'follows_me', 'current_room_id')
 
-class User(BaseUser, Repr):
     def __init__(self, user_id: str, username: str, displayname: str, avatar_url: str, bio: str, last_seen: str,
                  online: bool,
                  following: bool, room_permissions: Permission, num_followers: int, num_following: int,
@@ -127,7 +181,8 @@ class User(BaseUser, Repr):
         """
         super().__init__(user_id, username, displayname, avatar_url)
         self.bio: str = bio
-        self.last_seen: datetime = isoparse(last_seen)
+        self._last_seen_raw: str = last_seen
+        self._last_seen: Optional[datetime] = None
         self.online: bool = online
         self.following: bool = following
         self.room_permissions: Permission = room_permissions
@@ -139,6 +194,14 @@ class User(BaseUser, Repr):
     def __str__(self):
         return self.username
 
+    @property
+    def last_seen(self) -> datetime:
+        """When the user was last online. (Lazily parsed from the raw timestamp on first access)"""
+        last_seen = self._last_seen
+        if last_seen is None:
+            self._last_seen = last_seen = _iso(self._last_seen_raw)
+        return last_seen
+
     @staticmethod
     def from_dict(data: dict):
         """
@@ -168,10 +231,13 @@ class User(BaseUser, Repr):
 
     @classmethod
     async def convert(cls, ctx, param, argument: str):
-        return await cls._get_user(cls.__name__, ctx.client, param, argument)
+        return await get_user(cls.__name__, ctx.client, param, argument)
 
 
-class UserPreview(Convertor, Repr):
+@fast_repr
+class UserPreview:
+    __slots__ = ('id', 'displayname', 'num_followers')
+
     def __init__(self, user_id: str, displayname: str, num_followers: int):
         """
         Represents a user-preview from the Client.rooms users list.
@@ -203,11 +269,15 @@ class UserPreview(Convertor, Repr):
 
     @classmethod
     async def convert(cls, ctx, param, argument: str):
-        user = await cls._get_user(cls.__name__, ctx.client, param, argument)
+        user = await get_user(cls.__name__, ctx.client, param, argument)
         return UserPreview(user.id, user.displayname, user.num_followers)
 
 
-class Room(Repr):
+@fast_repr
+class Room:
+    __slots__ = ('id', 'creator_id', 'name', 'description', '_created_at_raw', '_created_at', 'is_private',
+                 'count', '_users', '_raw_users')
+
     def __init__(self, room_id: str, creator_id: str, name: str, description: str, created_at: str, is_private: bool,
                  count: int, users: List[Union[User, UserPreview]]):
         """
@@ -227,10 +297,12 @@ class Room(Repr):
         self.creator_id: str = creator_id
         self.name: str = name
         self.description: str = description
-        self.created_at: datetime = isoparse(created_at)
+        self._created_at_raw: str = created_at
+        self._created_at: Optional[datetime] = None
         self.is_private: bool = is_private
         self.count: int = count
-        self.users: List[Union[User, UserPreview]] = users
+        self._users: Optional[List[Union[User, UserPreview]]] = users
+        self._raw_users: Optional[List[dict]] = None
 
     def __str__(self):
         return self.name
@@ -238,6 +310,28 @@ class Room(Repr):
     def __sizeof__(self):
         return self.count
 
+    @property
+    def created_at(self) -> datetime:
+        """When the room was created. (Lazily parsed from the raw timestamp on first access)"""
+        created_at = self._created_at
+        if created_at is None:
+            self._created_at = created_at = _iso(self._created_at_raw)
+        return created_at
+
+    @property
+    def users(self) -> List[Union[User, UserPreview]]:
+        """A list of users whom reside in this room. (Lazily built from the raw server payload on first access)"""
+        users = self._users
+        if users is None:
+            raw = self._raw_users
+            self._users = users = [UserPreview(user["id"], user["displayName"], user["numFollowers"])
+                                   for user in raw] if raw else []
+        return users
+
+    @users.setter
+    def users(self, value: List[Union[User, UserPreview]]):
+        self._users = value
+
     @staticmethod
     def from_dict(data: dict):
         """
@@ -249,12 +343,16 @@ class Room(Repr):
         Returns:
             Room: A parsed room object which contains the data from the dictionary.
         """
-        return Room(data["id"], data["creatorId"], data["name"], data["description"], data["inserted_at"],
-                    data["isPrivate"], data["numPeopleInside"],
-                    list(map(UserPreview.from_dict, data["peoplePreviewList"])))
+        room = Room(data["id"], data["creatorId"], data["name"], data["description"], data["inserted_at"],
+                    data["isPrivate"], data["numPeopleInside"], None)
+        room._raw_users = data["peoplePreviewList"]
+        return room
+
 
+@fast_repr
+class Message:
+    __slots__ = ('id', 'tokens', 'is_whisper', '_created_at_raw', '_created_at', 'author', 'content')
 
-class Message(Repr):
     def __init__(self, message_id: str, tokens: List[Dict[str, str]], is_whisper: bool, created_at: str,
                  author: BaseUser):
         """
@@ -270,13 +368,22 @@ class Message(Repr):
         self.id = message_id
         self.tokens = tokens
         self.is_whisper = is_whisper
-        self.created_at = isoparse(created_at)
+        self._created_at_raw = created_at
+        self._created_at = None
         self.author = author
         self.content = parse_tokens(tokens)
 
     def __str__(self):
         return self.content
 
+    @property
+    def created_at(self) -> datetime:
+        """When the message was created. (Lazily parsed from the raw timestamp on first access)"""
+        created_at = self._created_at
+        if created_at is None:
+            self._created_at = created_at = _iso(self._created_at_raw)
+        return created_at
+
     @staticmethod
     def from_dict(data: dict):
         """
@@ -288,10 +395,15 @@ class Message(Repr):
         Returns:
             Message: A parsed message object which contains the data from the dictionary.
         """
-        return Message(data["id"], data["tokens"], data["isWhisper"], data["sentAt"], BaseUser.from_dict(data))
+        get = data.get
+        return Message(get("id"), get("tokens"), get("isWhisper"), get("sentAt"),
+                       _author(get("userId"), get("username"), get("displayName"), get("avatarUrl")))
 
 
-class Client(Repr):
+@fast_repr
+class Client:
+    __slots__ = ('user', 'room', 'rooms', 'prefix')
+
     def __init__(self, user: Optional[User], room: Optional[Union[Room, str]], rooms: List[Room], prefix: List[str]):
         """
         The base client for the DogeHouse client.
@@ -310,7 +422,10 @@ class Client(Repr):
         self.prefix: List[str] = prefix
 
 
-class Context(Repr):
+@fast_repr
+class Context:
+    __slots__ = ('client', 'bot', 'message', 'author')
+
     def __init__(self, client: Client, message: Message):
         """
         Represents a message its context.
@@ -68,7 +68,15 @@ class CommandNotFound(DogehouseException):
 
 class MemberNotFound(DogehouseException):
     """The requested member was not found!"""
-    pass
+
+    def __str__(self):
+        # When raised with a (convertor, argument) pair the message only
+        # gets formatted here, so convertor failures that get caught and
+        # ignored never pay for the string construction.
+        if len(self.args) == 2:
+            convertor, argument = self.args
+            return f"Could not find/create {convertor} using the {convertor} convertor for argument `{argument}`"
+        return super().__str__()
 
 
 class CommandAlreadyDefined(DogehouseException):
@@ -5,63 +5,112 @@ except (ImportError, ModuleNotFoundError):
     raise ImportError(
         "To use telemetry you must install the `telemetry` option. (run `pip install -U dogehouse[telemetry]`)")
 
-from json import dumps
+try:
+    from orjson import dumps as _orjson_dumps
 
-socket = AsyncClient()
-activated = False
-err_occurred_on_connect = False
+    def dumps(payload) -> str:
+        return _orjson_dumps(payload).decode()
+except (ImportError, ModuleNotFoundError):
+    from json import dumps
 
+from asyncio import ensure_future, get_running_loop
 
-@socket.event
-async def connect():
-    global activated
+from ..entities import User
+
+socket = AsyncClient()
+
+# Mutable connection state, bound as a default argument below so the hot
+# transmit path reads it with LOAD_FAST instead of two global lookups.
+_state = {"activated": False, "connect_error": False, "pending": None, "scheduled": False}
+
+# How long transmit coalesces bursts before actually emitting. Telemetry is
+# best-effort, so only the latest state within the window gets sent.
+debounceDelay = 0.25
+
+# Pre-sized template for the per-user payload dicts; copying it and
+# assigning into the existing keys skips the hash/grow cycles a fresh
+# 7-key dict literal pays, and the defaults already cover preview users.
+_USER_TEMPLATE = {"id": None, "bio": None, "avatarUrl": None, "username": None,
+                  "displayName": None, "numFollowers": 0, "numFollowing": 0}
+
+
+def _user_dict(user, _isinstance=isinstance):
+    data = _USER_TEMPLATE.copy()
+    data["id"] = user.id
+    data["displayName"] = user.displayname
+    data["numFollowers"] = user.num_followers
+    if _isinstance(user, User):
+        data["bio"] = user.bio
+        data["avatarUrl"] = user.avatar_url
+        data["username"] = user.username
+        data["numFollowing"] = user.num_following
+    return data
+
+
+def _build_payload(bot, room, users):
+    """Builds and serializes the transmit payload; runs on an executor thread so big rooms don't stall the
+    event loop."""
+    return dumps({
+        "bot": {
+            "type": "dogehouse.py",
+            "uuid": bot.id,
+            "username": bot.username,
+            "avatarURL": bot.avatar_url
+        },
+        "room": {
+            "uuid": room.id,
+            "name": room.name,
+            "listening": room.count,
+            "users": [_user_dict(user) for user in users]
+        } if room else None
+    })
 
-    activated = True
 
+@socket.event
+async def connect(_state=_state):
+    _state["activated"] = True
 
-async def transmit(client):
-    global activated, err_occurred_on_connect
 
-    if err_occurred_on_connect:
+async def transmit(client, _state=_state):
+    if _state["connect_error"]:
         return await start()
 
-    if not activated or not hasattr(client.user, "id"):
+    if not _state["activated"] or not hasattr(client.user, "id"):
         return
 
-    await socket.emit("transmit", dumps({
-        "bot": {
-            "type": "dogehouse.py",
-            "uuid": client.user.id,
-            "username": client.user.username,
-            "avatarURL": client.user.avatar_url
-        },
-        "room": {
-            "uuid": client.room.id,
-            "name": client.room.name,
-            "listening": client.room.count,
-            "users": [
-                {
-                    "id": user.id,
-                    "bio": user.bio if hasattr(user, "bio") else None,
-                    "avatarUrl": user.avatar_url if hasattr(user, "avatar_url") else None,
-                    "username": user.username if hasattr(user, "username") else None,
-                    "displayName": user.displayname,
-                    "numFollowers": user.num_followers,
-                    "numFollowing": user.num_following if hasattr(user, "num_following") else 0,
-                } for user in client.room.users
-            ]
-        } if client.room else None
-    }))
-
-
-async def start():
-    global err_occurred_on_connect
+    # Coalesce bursts: remember only the latest state and emit once the
+    # debounce window closes, so 100 transmits in rapid succession cost one
+    # serialization instead of 100.
+    _state["pending"] = client
+    if not _state["scheduled"]:
+        _state["scheduled"] = True
+        get_running_loop().call_later(debounceDelay, _flush)
+
+
+def _flush(_state=_state):
+    _state["scheduled"] = False
+    client = _state["pending"]
+    _state["pending"] = None
+    if client is not None:
+        ensure_future(_transmit_now(client))
+
+
+async def _transmit_now(client, _emit=socket.emit):
+    # Snapshot the fields the worker thread needs; the dict building and
+    # serialization then happen off the event loop thread.
+    bot, room = client.user, client.room
+    users = list(room.users) if room else None
+    payload = await get_running_loop().run_in_executor(None, _build_payload, bot, room, users)
+    await _emit("transmit", payload)
+
+
+async def start(_state=_state):
     try:
         await socket.connect("wss://socket.dogegarden.net", transports=["websocket"], socketio_path="/socket")
-        err_occurred_on_connect = False
+        _state["connect_error"] = False
         await socket.wait()
     except ConnectionError:
-        err_occurred_on_connect = True
+        _state["connect_error"] = True
 
 
 class Dogegarden:
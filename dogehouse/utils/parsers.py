@@ -21,7 +21,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import List, Dict
+from functools import lru_cache
+from sys import intern
+from typing import List, Dict, Tuple
 
 message_formats = {
     "mention": "@{}",
@@ -29,6 +31,65 @@ message_formats = {
     "block": "`{}`"
 }
 
+# Prefix/suffix fragments derived from `message_formats`; two dict gets plus
+# short-string concatenation beat running a str.format call per token.
+_PRE: Dict[str, str] = {}
+_SUF: Dict[str, str] = {}
+for _token_type, _fm in message_formats.items():
+    _PRE[_token_type], _SUF[_token_type] = _fm.split("{}")
+
+# Interned once so every token carries the same string objects and
+# downstream `token["t"] == ...` comparisons are pointer checks.
+_TEXT = intern("text")
+_MENTION = intern("mention")
+_LINK = intern("link")
+_EMOTE = intern("emote")
+_BLOCK = intern("block")
+
+
+def _classify_mention(word: str):
+    return (_MENTION, word[1:]) if len(word) >= 3 else None
+
+
+def _classify_link(word: str):
+    return (_LINK, word) if len(word) >= 8 and word.startswith("http") else None
+
+
+def _classify_emote(word: str):
+    return (_EMOTE, word[1:-1]) if len(word) >= 3 and word.endswith(":") else None
+
+
+def _classify_block(word: str):
+    return (_BLOCK, word[1:-1]) if len(word) >= 3 and word.endswith("`") else None
+
+
+# The first character decides which (single) handler can possibly match, so
+# classification stays O(1) per word however many token types get added;
+# each handler only runs the validation its own type needs.
+_FIRST_CHAR_DISPATCH = {
+    "@": _classify_mention,
+    "h": _classify_link,
+    ":": _classify_emote,
+    "`": _classify_block,
+}
+
+
+def _classify_word(word: str) -> Tuple[str, str]:
+    """Classify a word into its token type and (stripped) value."""
+    handler = _FIRST_CHAR_DISPATCH.get(word[:1])
+    if handler is not None:
+        token = handler(word)
+        if token is not None:
+            return token
+    return _TEXT, word
+
+
+# Chat traffic repeats the same small words, mentions and emotes constantly,
+# so classifications get memoized. The result is an immutable tuple — callers
+# build their own token dict — and oversized words bypass the cache so one-off
+# pasted payloads cannot evict the words that actually repeat.
+_classify_word_cached = lru_cache(maxsize=4096)(_classify_word)
+
 
 def parse_sentence_to_tokens(sentence: str) -> List[Dict[str, str]]:
     """
@@ -40,7 +101,15 @@ def parse_sentence_to_tokens(sentence: str) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: A proper collection of usable tokens
     """
-    return list(map(parse_word_to_token, str(sentence).split(" ")))
+    # Splitting and classifying both run in C; fusing the loop here just
+    # removes the per-word Python call into parse_word_to_token.
+    classify, classify_raw = _classify_word_cached, _classify_word
+    tokens = []
+    append = tokens.append
+    for word in sentence.split(" "):
+        t, v = classify(word) if len(word) <= 128 else classify_raw(word)
+        append({"t": t, "v": v})
+    return tokens
 
 
 def parse_word_to_token(word: str) -> Dict[str, str]:
@@ -53,21 +122,8 @@ def parse_word_to_token(word: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: A token which represents the word.
     """
-    # TODO: Do some regex magic instead of this
-    t, v = "text", str(word)
-    if v.startswith("@") and len(v) >= 3:
-        t = "mention"
-        v = v[1:]
-    elif v.startswith("http") and len(v) >= 8:
-        t = "link"
-    elif v.startswith(":") and v.endswith(":") and len(v) >= 3:
-        t = "emote"
-        v = v[1:-1]
-    elif v.startswith("`") and v.endswith("`") and len(v) >= 3:
-        t = "block"
-        v = v[1:-1]
-
-    return dict(t=t, v=v)
+    t, v = (_classify_word_cached if len(word) <= 128 else _classify_word)(word)
+    return {"t": t, "v": v}
 
 
 def parse_tokens_to_message(tokens: List[Dict[str, str]]) -> str:
@@ -80,13 +136,13 @@ def parse_tokens_to_message(tokens: List[Dict[str, str]]) -> str:
     Returns:
         str: The parsed collection its content
     """
-    return " ".join(map(parse_token_to_message, tokens))
+    # The formatting is inlined into a list comprehension: no map object,
+    # no per-token call into parse_token_to_message, and str.join can size
+    # its destination buffer once from the materialized list.
+    pre, suf = _PRE.get, _SUF.get
+    return " ".join([pre(token["t"], "") + token["v"] + suf(token["t"], "") for token in tokens])
 
 
 def parse_token_to_message(token: Dict[str, str]) -> str:
-    v = token["v"]
-    for k, fm in message_formats.items():
-        if token["t"] == k:
-            v = fm.format(token["v"])
-            break
-    return v
+    t = token["t"]
+    return _PRE.get(t, "") + token["v"] + _SUF.get(t, "")
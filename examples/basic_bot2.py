@@ -28,6 +28,11 @@
 from dogehouse import DogeClient
 from dogehouse.entities import User, Message
 
+# Bound once at import, so the hot handlers reuse a single format callable
+# instead of rebuilding the string formatting machinery each call.
+WELCOME_TEMPLATE = "Welcome {mention}".format
+HELLO_TEMPLATE = "Hello {mention}".format
+
 
 client = DogeClient("YourToken", "YourRefreshToken")
 
@@ -40,13 +45,13 @@ async def on_ready(self):
 
 @client.listener
 async def on_user_join(self, user: User):
-    await self.send(f"Welcome {user.mention}")
+    await self.send(WELCOME_TEMPLATE(mention=user.mention))
 
 
 @client.listener
 async def on_message(self, message: Message):
     if message.content.startswith("!hello"):
-        await self.send(f"Hello {message.author.mention}")
+        await self.send(HELLO_TEMPLATE(mention=message.author.mention))
             
 
 if __name__ == "__main__":
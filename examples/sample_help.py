@@ -21,7 +21,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from inspect import getdoc
 from dogehouse import DogeClient, event, command
 
 class Client(DogeClient):
@@ -50,8 +49,9 @@ class Client(DogeClient):
         else:
             cmd = cmd.lower()
             try:
-                await self.send(f"`{cmd}` : {getdoc(self.commands[cmd][0])}")
-            except IndexError:
+                # The cleaned-up docstring gets cached at registration.
+                await self.send(f"`{cmd}` : {self.commands[cmd].help}")
+            except KeyError:
                 await self.send(f"Could not find '{cmd}'! Use {self.prefix}help to see all commands!")
     
 if __name__ == "__main__":
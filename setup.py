@@ -31,11 +31,11 @@ setup(
     keywords=["dogehouse"],
     install_requires=[
         "websockets",
-        "python-dateutil",
-        "represents"
+        "python-dateutil"
     ],
     extras_require={
-        "telemetry": ["python-socketio[asyncio_client]"]
+        "telemetry": ["python-socketio[asyncio_client]"],
+        "performance": ["orjson", "uvloop"]
     },
     classifiers=[
         # Development statuses: